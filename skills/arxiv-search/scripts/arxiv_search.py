@@ -5,30 +5,34 @@ Provides CLI interface for paper search and retrieval
 """
 
 import argparse
+import hashlib
 import importlib.util
 import json
 import logging
 import os
 import subprocess
 import sys
+import time
+from operator import attrgetter
 from pathlib import Path
 
 # Auto-setup: create venv and install dependencies if needed
 _SKILL_DIR = Path(__file__).resolve().parent.parent
 _VENV_DIR = _SKILL_DIR / ".venv"
-_REQUIRED = {"arxiv": "arxiv"}
+_VENV_PYTHON = str(_VENV_DIR / "bin" / "python3")
+_REQUIRED = {"arxiv": "arxiv", "orjson": "orjson"}
 
 if not sys.prefix.startswith(str(_VENV_DIR)):
     _env = {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
     if not _VENV_DIR.exists():
         subprocess.check_call([sys.executable, "-m", "venv", str(_VENV_DIR)])
     _pip = str(_VENV_DIR / "bin" / "pip")
-    _missing = [pkg for mod, pkg in _REQUIRED.items()
-                if subprocess.run([str(_VENV_DIR / "bin" / "python3"), "-c", f"import {mod}"],
-                                  capture_output=True).returncode != 0]
-    if _missing:
-        subprocess.check_call([_pip, "install", "-q"] + _missing, env=_env)
-    os.execv(str(_VENV_DIR / "bin" / "python3"), [str(_VENV_DIR / "bin" / "python3")] + sys.argv)
+    # Locate (without importing) all modules in one interpreter; on any miss install the full set
+    _probe = ("import importlib.util, sys; "
+              f"sys.exit(0 if all(importlib.util.find_spec(m) for m in {list(_REQUIRED)!r}) else 1)")
+    if subprocess.run([_VENV_PYTHON, "-c", _probe], capture_output=True).returncode != 0:
+        subprocess.check_call([_pip, "install", "-q"] + list(_REQUIRED.values()), env=_env)
+    os.execv(_VENV_PYTHON, [_VENV_PYTHON] + sys.argv)
 
 # Configure logging
 logging.basicConfig(
@@ -37,15 +41,82 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# On-disk result cache
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "arxiv-skill"
+_CACHE_TTL = 86400  # ArXiv listings update daily
 
-def arxiv_search(query: str, max_results: int = 5) -> dict:
-    """Search ArXiv for papers matching the query."""
+
+def _cache_key(*parts) -> str:
+    """Build a cache key from the call arguments."""
+    return hashlib.sha256("|".join(str(p) for p in parts).encode()).hexdigest()
+
+
+def _cache_get(key: str, ttl: int = _CACHE_TTL):
+    """Return a cached result if present and younger than ttl seconds."""
+    path = _CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_put(key: str, obj) -> None:
+    """Store a result in the cache, ignoring filesystem errors."""
+    path = _CACHE_DIR / f"{key}.json"
     try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Could not write cache entry: {e}")
+
+
+# Author name accessor shared by the result formatters
+_NAME = attrgetter("name")
+
+# Imported on first use and cached per process
+_ARXIV = None
+
+# API client shared by all calls so its HTTP session is reused
+_CLIENT = None
+
+
+def _arxiv():
+    """Return the arxiv module, importing it on first use."""
+    global _ARXIV
+    if _ARXIV is None:
         import arxiv
+        _ARXIV = arxiv
+    return _ARXIV
 
+
+def _get_client():
+    """Return the shared arxiv.Client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = _arxiv().Client(page_size=100, delay_seconds=3, num_retries=3)
+    return _CLIENT
+
+
+def arxiv_search(query: str, max_results: int = 5) -> dict:
+    """Search ArXiv for papers matching the query."""
+    try:
         max_results = min(max_results, 20)
 
-        client = arxiv.Client()
+        cache_key = _cache_key("search", query, max_results)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"ArXiv search served from cache for '{query}'")
+            return cached
+
+        arxiv = _arxiv()
+
+        client = _get_client()
         search = arxiv.Search(
             query=query,
             max_results=max_results,
@@ -58,7 +129,7 @@ def arxiv_search(query: str, max_results: int = 5) -> dict:
             results.append({
                 "index": idx,
                 "title": paper.title,
-                "authors": ", ".join([a.name for a in paper.authors]),
+                "authors": ", ".join(map(_NAME, paper.authors)),
                 "published": paper.published.strftime("%Y-%m-%d"),
                 "paper_id": paper_id,
                 "abstract": paper.summary,
@@ -69,12 +140,14 @@ def arxiv_search(query: str, max_results: int = 5) -> dict:
 
         logger.info(f"ArXiv search completed: {len(results)} results for '{query}'")
 
-        return {
+        result = {
             "success": True,
             "query": query,
             "result_count": len(results),
             "results": results
         }
+        _cache_put(cache_key, result)
+        return result
 
     except Exception as e:
         logger.error(f"ArXiv search error: {e}")
@@ -84,11 +157,17 @@ def arxiv_search(query: str, max_results: int = 5) -> dict:
 def arxiv_get_paper(paper_ids: str, max_length: int = 5000) -> dict:
     """Get detailed paper content by ID(s)."""
     try:
-        import arxiv
+        cache_key = _cache_key("paper", paper_ids, max_length)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            logger.info("ArXiv paper retrieval served from cache")
+            return cached
+
+        arxiv = _arxiv()
 
         id_list = [pid.strip().split("/")[-1] for pid in paper_ids.split(",")]
 
-        client = arxiv.Client()
+        client = _get_client()
         search = arxiv.Search(id_list=id_list)
 
         papers = []
@@ -101,7 +180,7 @@ def arxiv_get_paper(paper_ids: str, max_length: int = 5000) -> dict:
             papers.append({
                 "paper_id": paper_id,
                 "title": paper.title,
-                "authors": ", ".join([a.name for a in paper.authors]),
+                "authors": ", ".join(map(_NAME, paper.authors)),
                 "published": paper.published.strftime("%Y-%m-%d"),
                 "abstract": paper.summary,
                 "pdf_url": paper.pdf_url,
@@ -117,17 +196,29 @@ def arxiv_get_paper(paper_ids: str, max_length: int = 5000) -> dict:
 
         logger.info(f"ArXiv paper retrieval: {len(papers)} paper(s)")
 
-        return {
+        result = {
             "success": True,
             "papers_retrieved": len(papers),
             "papers": papers
         }
+        _cache_put(cache_key, result)
+        return result
 
     except Exception as e:
         logger.error(f"ArXiv paper retrieval error: {e}")
         return {"success": False, "error": str(e), "paper_ids": paper_ids}
 
 
+def _dumps(obj, indent: bool = True) -> str:
+    """Serialize obj to JSON with orjson, falling back to the stdlib encoder."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(obj, option=option).decode()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='ArXiv Search Skill - Search and retrieve scientific papers',
@@ -163,7 +254,7 @@ Examples:
     else:
         result = arxiv_get_paper(args.paper_ids, max_length=args.max_length)
 
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    print(_dumps(result))
     sys.exit(0 if result.get("success") else 1)
 
 
@@ -6,11 +6,15 @@ Provides CLI interface for web search and content extraction
 
 import argparse
 import asyncio
+import hashlib
 import json
 import logging
+import re
 import subprocess
 import sys
-from typing import Optional, Dict, List, Any
+import time
+from html import unescape
+from typing import TYPE_CHECKING, Optional, Dict, List, Any, Tuple
 
 # Auto-setup: create venv and install dependencies if needed
 import importlib.util
@@ -19,7 +23,9 @@ from pathlib import Path
 
 _SKILL_DIR = Path(__file__).resolve().parent.parent
 _VENV_DIR = _SKILL_DIR / ".venv"
-_REQUIRED = {"ddgs": "ddgs", "httpx": "httpx", "bs4": "beautifulsoup4"}
+_VENV_PYTHON = str(_VENV_DIR / "bin" / "python3")
+_REQUIRED = {"ddgs": "ddgs", "aiohttp": "aiohttp", "bs4": "beautifulsoup4", "lxml": "lxml",
+             "orjson": "orjson"}
 
 # If not running inside the skill venv, bootstrap and re-exec
 if not sys.prefix.startswith(str(_VENV_DIR)):
@@ -27,12 +33,12 @@ if not sys.prefix.startswith(str(_VENV_DIR)):
     if not _VENV_DIR.exists():
         subprocess.check_call([sys.executable, "-m", "venv", str(_VENV_DIR)])
     _pip = str(_VENV_DIR / "bin" / "pip")
-    _missing = [pkg for mod, pkg in _REQUIRED.items()
-                if subprocess.run([str(_VENV_DIR / "bin" / "python3"), "-c", f"import {mod}"],
-                                  capture_output=True).returncode != 0]
-    if _missing:
-        subprocess.check_call([_pip, "install", "-q"] + _missing, env=_env)
-    os.execv(str(_VENV_DIR / "bin" / "python3"), [str(_VENV_DIR / "bin" / "python3")] + sys.argv)
+    # Locate (without importing) all modules in one interpreter; on any miss install the full set
+    _probe = ("import importlib.util, sys; "
+              f"sys.exit(0 if all(importlib.util.find_spec(m) for m in {list(_REQUIRED)!r}) else 1)")
+    if subprocess.run([_VENV_PYTHON, "-c", _probe], capture_output=True).returncode != 0:
+        subprocess.check_call([_pip, "install", "-q"] + list(_REQUIRED.values()), env=_env)
+    os.execv(_VENV_PYTHON, [_VENV_PYTHON] + sys.argv)
 
 # Configure logging
 logging.basicConfig(
@@ -41,13 +47,99 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    import aiohttp
 
-def extract_text_from_html(html: str, max_length: int = 50000) -> str:
-    """Extract clean text from HTML content"""
-    try:
+# Heavy third-party modules, imported on first use and cached per process
+_BS = None
+_AIOHTTP = None
+_DDGS_CLASS = None
+
+# Search session reused across calls so its engines keep their HTTP clients
+_DDGS = None
+
+
+# Whitespace normalization for extracted text
+_SPACE_RUN = re.compile(r' {2,}')
+_LINE_BREAKS = re.compile(r'\s*\n\s*')
+_HTML_TAG = re.compile(r'<[^>]+>')
+_WHITESPACE = re.compile(r'\s+')
+
+# <title> lookup without building a DOM; only the document head is scanned
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.I | re.S)
+_TITLE_SCAN_CHARS = 8192
+
+
+def _bs():
+    """Return the BeautifulSoup class, importing bs4 on first use"""
+    global _BS
+    if _BS is None:
         from bs4 import BeautifulSoup
+        _BS = BeautifulSoup
+    return _BS
+
+
+def _aiohttp():
+    """Return the aiohttp module, importing it on first use"""
+    global _AIOHTTP
+    if _AIOHTTP is None:
+        import aiohttp
+        _AIOHTTP = aiohttp
+    return _AIOHTTP
+
+
+def _ddgs():
+    """Return the DDGS class, importing ddgs on first use"""
+    global _DDGS_CLASS
+    if _DDGS_CLASS is None:
+        from ddgs import DDGS
+        _DDGS_CLASS = DDGS
+    return _DDGS_CLASS
+
+
+def _get_ddgs():
+    """Return the shared DDGS instance, creating it on first use"""
+    global _DDGS
+    if _DDGS is None:
+        _DDGS = _ddgs()()
+    return _DDGS
+
+
+def _truncate(text: str, max_length: int) -> str:
+    """Limit text to max_length characters, marking any truncation"""
+    if len(text) > max_length:
+        return text[:max_length] + "\n\n[Content truncated...]"
+    return text
+
 
-        soup = BeautifulSoup(html, 'html.parser')
+def _sniff_title(html: str) -> str:
+    """Extract the page title with a regex over the start of the document"""
+    match = _TITLE_RE.search(html, 0, _TITLE_SCAN_CHARS)
+    if match:
+        return _WHITESPACE.sub(' ', unescape(match.group(1))).strip()
+    return "No title"
+
+
+def _make_soup(html: str):
+    """Parse HTML with lxml, falling back to the pure-Python parser"""
+    from bs4 import FeatureNotFound
+
+    try:
+        return _bs()(html, 'lxml')
+    except FeatureNotFound:
+        logger.warning("lxml not available, falling back to html.parser")
+        return _bs()(html, 'html.parser')
+
+
+def extract_from_html(html: str, max_length: int = 50000) -> Tuple[str, str]:
+    """Extract the page title and clean text from HTML content in a single parse"""
+    try:
+        soup = _make_soup(html)
+
+        # Extract title
+        title = "No title"
+        if soup.title:
+            title = soup.title.get_text().strip()
 
         # Remove script and style elements
         for script in soup(["script", "style", "nav", "footer", "header"]):
@@ -56,36 +148,75 @@ def extract_text_from_html(html: str, max_length: int = 50000) -> str:
         # Get text
         text = soup.get_text()
 
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = '\n'.join(chunk for chunk in chunks if chunk)
+        # Clean up whitespace: runs of 2+ spaces and blank lines become single newlines
+        text = _LINE_BREAKS.sub('\n', _SPACE_RUN.sub('\n', text)).strip()
 
-        # Limit length
-        if len(text) > max_length:
-            text = text[:max_length] + "\n\n[Content truncated...]"
-
-        return text
+        return title, _truncate(text, max_length)
 
     except ImportError:
         logger.warning("BeautifulSoup not available, using basic text extraction")
         # If BeautifulSoup not available, return raw text with basic cleanup
-        import re
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', html)
+        text = _HTML_TAG.sub('', html)
         # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE.sub(' ', text).strip()
+
+        return _sniff_title(html), _truncate(text, max_length)
+
+
+# Upper bound on raw HTML bytes read per character of extracted text
+_HTML_BYTES_PER_CHAR = 4
 
-        if len(text) > max_length:
-            text = text[:max_length] + "\n\n[Content truncated...]"
+# Media types parsed as HTML, and other types returned as plain text without parsing
+_HTML_TYPES = ("text/html", "application/xhtml+xml")
+_TEXT_TYPES = ("text/", "application/json", "application/xml")
 
-        return text
+# Per-URL validators and extracted content for conditional GETs
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "web-search"
+
+
+def _cache_path(url: str) -> Path:
+    """Return the cache file for a URL"""
+    return _CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+
+def _cache_get(url: str) -> Optional[Dict[str, Any]]:
+    """Return the cached entry for a URL, if any"""
+    try:
+        with open(_cache_path(url), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_put(url: str, entry: Dict[str, Any]) -> None:
+    """Store the cache entry for a URL, ignoring filesystem errors"""
+    path = _cache_path(url)
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Could not write cache entry: {e}")
+
+
+def _new_http_session():
+    """Create a pooled HTTP session shared across fetches"""
+    aiohttp = _aiohttp()
+
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=30),
+        connector=aiohttp.TCPConnector(limit=50, limit_per_host=10)
+    )
 
 
 async def fetch_url_content(
     url: str,
     include_html: bool = False,
-    max_length: int = 50000
+    max_length: int = 50000,
+    session: Optional["aiohttp.ClientSession"] = None
 ) -> Dict[str, Any]:
     """
     Fetch and extract text content from a web page URL.
@@ -94,13 +225,12 @@ async def fetch_url_content(
         url: The URL to fetch (must start with http:// or https://)
         include_html: If True, includes raw HTML in response
         max_length: Maximum character length of extracted text
+        session: Optional shared aiohttp.ClientSession; a new one is created if omitted
 
     Returns:
         Dictionary with extracted content or error information
     """
     try:
-        import httpx
-
         # Validate URL
         if not url.startswith(('http://', 'https://')):
             return {
@@ -109,70 +239,129 @@ async def fetch_url_content(
                 "url": url
             }
 
-        # Fetch URL with timeout
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (compatible; WebSearchSkill/1.0)"
-            }
+        if session is None:
+            async with _new_http_session() as session:
+                return await fetch_url_content(url, include_html, max_length, session=session)
 
-            response = await client.get(url, headers=headers)
+        # Fetch URL, revalidating any cached copy
+        headers = {
+            "User-Agent": "Mozilla/5.0 (compatible; WebSearchSkill/1.0)"
+        }
+        cached = _cache_get(url)
+        if cached and cached.get("max_length", 0) < max_length:
+            # Cached body was capped too short for this request; fetch in full
+            cached = None
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        # Stream the body and stop reading once we have enough HTML for max_length of text
+        byte_limit = max_length * _HTML_BYTES_PER_CHAR
+        async with session.get(url, headers=headers) as response:
             response.raise_for_status()
-
-            # Get content
-            html_content = response.text
+            not_modified = cached is not None and response.status == 304
+            etag = response.headers.get('etag')
+            last_modified = response.headers.get('last-modified')
             content_type = response.headers.get('content-type', '')
+            encoding = response.charset or 'utf-8'
+
+            # Servers that omit the type are assumed to send HTML
+            mime = content_type.split(';', 1)[0].strip().lower()
+            is_html = not mime or mime.startswith(_HTML_TYPES)
+            is_text = is_html or mime.startswith(_TEXT_TYPES)
+
+            body = bytearray()
+            if is_text and not not_modified:
+                async for chunk in response.content.iter_any():
+                    body += chunk
+                    if len(body) > byte_limit:
+                        break
+
+        note = None
+        if not_modified:
+            # Reuse the cached page; re-extract only if a different length was requested
+            logger.info(f"Not modified, using cached content for: {url}")
+            content_type = cached["content_type"]
+            html_content = cached["html_content"]
+            if cached["max_length"] == max_length:
+                title, text_content = cached["title"], cached["text_content"]
+            else:
+                title, text_content = extract_from_html(html_content, max_length)
+        elif not is_text:
+            # Binary content (PDF, images, ...) is neither downloaded nor parsed
+            logger.info(f"Skipping non-HTML content ({mime}) from: {url}")
+            title, text_content, html_content = "No title", "", ""
+            note = f"Content type {mime} is not HTML or text; body was not downloaded"
+        else:
+            # Drop any overshoot from the last chunk so only kept bytes are decoded
+            del body[byte_limit:]
 
-            # Extract title
-            title = "No title"
+            # Get content
             try:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(html_content, 'html.parser')
-                title_tag = soup.find('title')
-                if title_tag:
-                    title = title_tag.get_text().strip()
-            except:
-                pass
-
-            # Extract text
-            text_content = extract_text_from_html(html_content, max_length)
-
-            # Build response
-            result = {
-                "success": True,
-                "url": url,
-                "title": title,
-                "content_type": content_type,
-                "text_content": text_content,
-                "text_length": len(text_content),
-                "status_code": response.status_code
-            }
+                html_content = body.decode(encoding, errors='replace')
+            except LookupError:
+                html_content = body.decode('utf-8', errors='replace')
+
+            # Extract title and text; non-HTML text is returned without parsing
+            if is_html:
+                title, text_content = extract_from_html(html_content, max_length)
+            else:
+                title, text_content = "No title", _truncate(html_content.strip(), max_length)
+
+            if is_html and (etag or last_modified):
+                _cache_put(url, {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "cached_at": time.time(),
+                    "content_type": content_type,
+                    "max_length": max_length,
+                    "title": title,
+                    "text_content": text_content,
+                    "html_content": html_content
+                })
+
+        # Build response
+        result = {
+            "success": True,
+            "url": url,
+            "title": title,
+            "content_type": content_type,
+            "text_content": text_content,
+            "text_length": len(text_content),
+            "status_code": response.status
+        }
 
-            if include_html:
-                result["html_content"] = html_content[:max_length]
+        if note:
+            result["note"] = note
 
-            logger.info(f"Successfully fetched content from: {url} ({len(text_content)} chars)")
+        if include_html:
+            result["html_content"] = html_content[:max_length]
 
-            return result
+        logger.info(f"Successfully fetched content from: {url} ({len(text_content)} chars)")
+
+        return result
 
     except Exception as e:
         error_type = type(e).__name__
         logger.error(f"Error fetching URL {url}: {error_type} - {e}")
 
         # Handle specific error types
-        if "httpx" in str(type(e).__module__):
-            import httpx
-            if isinstance(e, httpx.HTTPStatusError):
+        if isinstance(e, asyncio.TimeoutError):
+            return {
+                "success": False,
+                "error": "Request timed out (30 seconds)",
+                "url": url
+            }
+        elif "aiohttp" in str(type(e).__module__):
+            aiohttp = _aiohttp()
+            if isinstance(e, aiohttp.ClientResponseError):
                 return {
                     "success": False,
-                    "error": f"HTTP error {e.response.status_code}: {e.response.reason_phrase}",
+                    "error": f"HTTP error {e.status}: {e.message}",
                     "url": url,
-                    "status_code": e.response.status_code
-                }
-            elif isinstance(e, httpx.TimeoutException):
-                return {
-                    "success": False,
-                    "error": "Request timed out (30 seconds)",
-                    "url": url
+                    "status_code": e.status
                 }
 
         return {
@@ -195,14 +384,13 @@ def ddg_web_search(query: str, max_results: int = 5) -> Dict[str, Any]:
     """
     try:
         # Import ddgs here to provide better error message if not installed
-        from ddgs import DDGS
+        ddgs = _get_ddgs()
 
         # Limit max_results to prevent abuse
         max_results = min(max_results, 10)
 
         # Perform search
-        with DDGS() as ddgs:
-            results = list(ddgs.text(query, max_results=max_results))
+        results = list(ddgs.text(query, max_results=max_results))
 
         # Format results
         formatted_results = []
@@ -269,12 +457,18 @@ async def search_and_fetch(
     results = search_results.get("results", [])
     urls_to_fetch = [r["link"] for r in results[:top_n]]
 
-    # Fetch content from each URL
-    fetched_content = []
-    for idx, url in enumerate(urls_to_fetch, 1):
-        logger.info(f"Fetching content from result {idx}/{len(urls_to_fetch)}: {url}")
-        content = await fetch_url_content(url, max_length=max_length)
+    # Fetch content from all URLs concurrently over a single pooled session
+    async with _new_http_session() as session:
+        async def fetch(idx: int, url: str) -> Dict[str, Any]:
+            logger.info(f"Fetching content from result {idx}/{len(urls_to_fetch)}: {url}")
+            return await fetch_url_content(url, max_length=max_length, session=session)
 
+        contents = await asyncio.gather(
+            *(fetch(idx, url) for idx, url in enumerate(urls_to_fetch, 1))
+        )
+
+    fetched_content = []
+    for idx, (url, content) in enumerate(zip(urls_to_fetch, contents), 1):
         fetched_content.append({
             "index": idx,
             "url": url,
@@ -295,6 +489,16 @@ async def search_and_fetch(
     }
 
 
+def _dumps(obj, indent: bool = True) -> str:
+    """Serialize obj to JSON with orjson, falling back to the stdlib encoder"""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(obj, option=option).decode()
+
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -395,8 +599,7 @@ Examples:
             result = ddg_web_search(args.query, args.max_results)
 
         # Output result
-        indent = 2 if args.pretty else None
-        print(json.dumps(result, indent=indent))
+        print(_dumps(result, indent=args.pretty))
 
         # Exit with appropriate code
         sys.exit(0 if result.get("success") else 1)
@@ -410,7 +613,7 @@ Examples:
             "success": False,
             "error": str(e)
         }
-        print(json.dumps(error_result, indent=2))
+        print(_dumps(error_result))
         sys.exit(1)
 
 
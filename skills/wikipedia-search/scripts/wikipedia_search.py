@@ -5,30 +5,36 @@ Provides CLI interface for Wikipedia search and article retrieval
 """
 
 import argparse
+import hashlib
 import importlib.util
 import json
 import logging
 import os
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import Optional
 
 # Auto-setup: create venv and install dependencies if needed
 _SKILL_DIR = Path(__file__).resolve().parent.parent
 _VENV_DIR = _SKILL_DIR / ".venv"
-_REQUIRED = {"wikipediaapi": "wikipedia-api"}
+_VENV_PYTHON = str(_VENV_DIR / "bin" / "python3")
+_REQUIRED = {"wikipediaapi": "wikipedia-api", "orjson": "orjson"}
 
 if not sys.prefix.startswith(str(_VENV_DIR)):
     _env = {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
     if not _VENV_DIR.exists():
         subprocess.check_call([sys.executable, "-m", "venv", str(_VENV_DIR)])
     _pip = str(_VENV_DIR / "bin" / "pip")
-    _missing = [pkg for mod, pkg in _REQUIRED.items()
-                if subprocess.run([str(_VENV_DIR / "bin" / "python3"), "-c", f"import {mod}"],
-                                  capture_output=True).returncode != 0]
-    if _missing:
-        subprocess.check_call([_pip, "install", "-q"] + _missing, env=_env)
-    os.execv(str(_VENV_DIR / "bin" / "python3"), [str(_VENV_DIR / "bin" / "python3")] + sys.argv)
+    # Locate (without importing) all modules in one interpreter; on any miss install the full set
+    _probe = ("import importlib.util, sys; "
+              f"sys.exit(0 if all(importlib.util.find_spec(m) for m in {list(_REQUIRED)!r}) else 1)")
+    if subprocess.run([_VENV_PYTHON, "-c", _probe], capture_output=True).returncode != 0:
+        subprocess.check_call([_pip, "install", "-q"] + list(_REQUIRED.values()), env=_env)
+    os.execv(_VENV_PYTHON, [_VENV_PYTHON] + sys.argv)
 
 # Configure logging
 logging.basicConfig(
@@ -37,11 +43,76 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# On-disk result cache
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "wikipedia-skill"
+_CACHE_TTL = 3600  # articles change more often than ArXiv listings
+
+
+def _cache_key(*parts) -> str:
+    """Build a cache key from the call arguments."""
+    return hashlib.sha256("|".join(str(p) for p in parts).encode()).hexdigest()
+
+
+def _cache_get(key: str, ttl: int = _CACHE_TTL):
+    """Return a cached result if present and younger than ttl seconds."""
+    path = _CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_put(key: str, obj) -> None:
+    """Store a result in the cache, ignoring filesystem errors."""
+    path = _CACHE_DIR / f"{key}.json"
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Could not write cache entry: {e}")
+
+
+# Imported on first use and cached per process
+_WIKIPEDIAAPI = None
+
+
+def _wikipediaapi():
+    """Return the wikipediaapi module, importing it on first use."""
+    global _WIKIPEDIAAPI
+    if _WIKIPEDIAAPI is None:
+        import wikipediaapi
+        _WIKIPEDIAAPI = wikipediaapi
+    return _WIKIPEDIAAPI
+
+
+def _related_entry(link_page) -> Optional[dict]:
+    """Summarize a linked page, or return None if it does not exist."""
+    if not link_page.exists():
+        return None
+    link_summary = link_page.summary
+    return {
+        "title": link_page.title,
+        "snippet": link_summary[:150] + "..." if len(link_summary) > 150 else link_summary,
+        "url": link_page.fullurl
+    }
+
 
 def wikipedia_search(query: str, language: str = "en") -> dict:
     """Search Wikipedia for articles matching the query."""
     try:
-        import wikipediaapi
+        cache_key = _cache_key("search", language, query)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Wikipedia search served from cache for '{query}'")
+            return cached
+
+        wikipediaapi = _wikipediaapi()
 
         wiki = wikipediaapi.Wikipedia(
             user_agent='WebSearchSkill/1.0',
@@ -62,16 +133,10 @@ def wikipedia_search(query: str, language: str = "en") -> dict:
         summary = page.summary
         snippet = summary[:300] + "..." if len(summary) > 300 else summary
 
-        # Also collect linked pages as related results
-        related = []
-        for title, link_page in list(page.links.items())[:5]:
-            if link_page.exists():
-                link_summary = link_page.summary
-                related.append({
-                    "title": link_page.title,
-                    "snippet": link_summary[:150] + "..." if len(link_summary) > 150 else link_summary,
-                    "url": link_page.fullurl
-                })
+        # Also collect linked pages as related results, probing them concurrently
+        link_pages = list(islice(page.links.values(), 5))
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            related = [r for r in executor.map(_related_entry, link_pages) if r]
 
         result = {
             "success": True,
@@ -88,6 +153,7 @@ def wikipedia_search(query: str, language: str = "en") -> dict:
             result["related"] = related
 
         logger.info(f"Wikipedia search completed for '{query}'")
+        _cache_put(cache_key, result)
         return result
 
     except Exception as e:
@@ -98,7 +164,13 @@ def wikipedia_search(query: str, language: str = "en") -> dict:
 def wikipedia_get_article(title: str, summary_only: bool = False, max_length: int = 5000, language: str = "en") -> dict:
     """Retrieve content from a Wikipedia article by exact title."""
     try:
-        import wikipediaapi
+        cache_key = _cache_key("article", language, title, summary_only, max_length)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Wikipedia article served from cache: '{title}'")
+            return cached
+
+        wikipediaapi = _wikipediaapi()
 
         wiki = wikipediaapi.Wikipedia(
             user_agent='WebSearchSkill/1.0',
@@ -125,11 +197,11 @@ def wikipedia_get_article(title: str, summary_only: bool = False, max_length: in
             if len(page.text) > max_length:
                 content += "\n\n[... Content truncated at {} characters]".format(max_length)
 
-        categories = list(page.categories.keys())[:5]
+        categories = list(islice(page.categories, 5))
 
         logger.info(f"Wikipedia article retrieved: '{title}' ({len(content)} chars)")
 
-        return {
+        result = {
             "success": True,
             "status": "success",
             "title": page.title,
@@ -139,12 +211,24 @@ def wikipedia_get_article(title: str, summary_only: bool = False, max_length: in
             "categories": categories,
             "character_count": len(content)
         }
+        _cache_put(cache_key, result)
+        return result
 
     except Exception as e:
         logger.error(f"Wikipedia article error: {e}")
         return {"success": False, "error": str(e), "title": title}
 
 
+def _dumps(obj, indent: bool = True) -> str:
+    """Serialize obj to JSON with orjson, falling back to the stdlib encoder."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(obj, option=option).decode()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Wikipedia Search Skill - Search and retrieve Wikipedia articles',
@@ -189,7 +273,7 @@ Examples:
             language=args.language
         )
 
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    print(_dumps(result))
     sys.exit(0 if result.get("success") else 1)
 
 